@@ -0,0 +1,8 @@
+from voice_detect.core import (
+    VoiceRequest,
+    VoiceResponse,
+    classify,
+    explain,
+    make_app,
+    shannon_entropy,
+)